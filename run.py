@@ -49,7 +49,6 @@ from PySide6.QtCore import Qt, QUrl, QTimer
 from PySide6.QtGui import QAction, QIcon
 from PySide6.QtWidgets import QApplication, QMenu, QSystemTrayIcon
 from PySide6.QtQml import QQmlApplicationEngine
-from pydub import AudioSegment
 
 from src.audio.audio import AudioManager, TranscriptionManager, TranscriptionService
 from src.core.config import AppConfig, AppState
@@ -112,8 +111,9 @@ def main() -> None:
     threading.Thread(target=audio_manager.initialize, daemon=True, name="AudioDriverWarmup").start()
 
     transcription_service = TranscriptionService(
-        app_state, cred_manager, vocab_manager, mode_manager
+        app_state, cred_manager, vocab_manager, mode_manager, event_bus
     )
+    threading.Thread(target=transcription_service.warm_up, daemon=True, name="TranscriptionWarmup").start()
     transcription_manager = TranscriptionManager(
         app_state, audio_manager, sound_manager, stats_manager,
         hist_manager, transcription_service, clipboard_manager, event_bus
@@ -182,6 +182,8 @@ def main() -> None:
         else:
             visualizer_window = obj
 
+    app.aboutToQuit.connect(hist_manager.close)
+
     if settings_manager.get("auto_check_updates"):
         update_manager.check_for_updates()
 
@@ -1,19 +1,16 @@
 import io
 import logging
-import os
-import tempfile
 import threading
 import time
 import wave
 import re
-import uuid
-from pathlib import Path
+from functools import lru_cache
+from itertools import islice
+from typing import Optional
 
 import numpy as np
 import pyaudio
 import win32gui
-from groq import Groq
-from pydub import AudioSegment
 
 from src.core.config import AppConfig, AppState, GROQ_MODEL_MAPPING
 from src.core.utils import SuppressStderr, PerfTracker
@@ -22,6 +19,34 @@ from src.core.system import global_executor
 
 logger = logging.getLogger(__name__)
 
+VAD_FRAME_SAMPLES = AppConfig.AUDIO_RATE * 30 // 1000
+# A frame is voiced once it clears the recording's own noise floor, so quiet or far-field mics still pass;
+# the fixed threshold only caps how strict that gets and the floor guards digital silence.
+VAD_RMS_THRESHOLD = 100.0
+VAD_RMS_FLOOR = 20.0
+VAD_NOISE_FLOOR_PERCENTILE = 10
+VAD_NOISE_FLOOR_RATIO = 3.0
+VAD_MIN_VOICED_SEC = 0.1
+
+# httpx's default 5 s keepalive closes the pooled connection before most uploads; keep it for a long dictation.
+GROQ_KEEPALIVE_SEC = 120.0
+# A request this recent already left a live connection in the pool, so the prewarm probe is skipped.
+GROQ_PREWARM_SKIP_SEC = 30.0
+
+WORD_PATTERN = re.compile(r"\w+")
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+# Paragraph-opening connectives for the email preset (en, fr, es, de, it, pt), matched on lowercased sentences.
+TRANSITION_PATTERN = re.compile(
+    r"however|nevertheless|furthermore|moreover|additionally|consequently|therefore|meanwhile|alternatively"
+    r"|specifically|finally|in\s+conclusion|to\s+conclude|on\s+the\s+other\s+hand|firstly|secondly|thirdly"
+    r"|cependant|néanmoins|par\s+ailleurs|de\s+plus|ensuite|enfin|en\s+conclusion|d'autre\s+part|toutefois"
+    r"|premièrement|deuxièmement"
+    r"|sin\s+embargo|además|por\s+lo\s+tanto|en\s+conclusión|por\s+outro\s+lado|finalmente"
+    r"|jedoch|außerdem|darüber\s+hinaus|zusammenfassend|schließlich|andererseits"
+    r"|tuttavia|inoltre|pertanto|in\s+conclusione|d'alta\s+parte|infine"
+    r"|no\s+entanto|além\s+disso|portanto|em\s+conclusão"
+)
+
 LANGUAGES_ISO = {
     "afrikaans": "af", "albanian": "sq", "amharic": "am", "arabic": "ar", "armenian": "hy",
     "assamese": "as", "azerbaijani": "az", "bashkir": "ba", "basque": "eu", "belarusian": "be",
@@ -45,6 +70,80 @@ LANGUAGES_ISO = {
     "vietnamese": "vi", "welsh": "cy", "yiddish": "yi", "yoruba": "yo"
 }
 
+PRESET_PROMPTS = {
+    "Email Draft": (
+        "Transcribe this audio as a professional email. "
+        "Use formal language, proper punctuation, and clear paragraph structure. "
+        "Do not include filler words, silence markers, or meta-text like 'Subtitles by...'. "
+        "Format with a greeting, body paragraphs, and a sign-off."
+    ),
+    "Equation": (
+        "Math dictation. Symbols, equations, variables, Greek letters, "
+        "fractions, integrals, superscripts, subscripts. "
+        "Example: integral from zero to infinity of x squared dx equals pi."
+    ),
+}
+
+PROMPT_MAX_CHARS = 500
+
+EMAIL_GREETINGS = {
+    "fr": "Bonjour,", "en": "Hello,", "es": "Hola,", "de": "Hallo,",
+    "it": "Buongiorno,", "pt": "Olá,", "nl": "Hallo,", "pl": "Dzień dobry,",
+    "ru": "Здравствуйте,", "zh": "您好，", "ja": "こんにちは、", "ko": "안녕하세요,",
+    "ar": "مرحباً،", "hi": "नमस्ते,", "tr": "Merhaba,", "sv": "Hej,",
+    "da": "Hej,", "no": "Hei,", "fi": "Hei,", "cs": "Dobrý den,",
+    "hu": "Tisztelt Címzett!", "el": "Γεια σας,", "he": "שלום,", "th": "สวัสดีครับ/ค่ะ,",
+    "vi": "Xin chào,", "id": "Halo,", "ms": "Helo,", "uk": "Вітаю,", "ro": "Bună ziua,"
+}
+
+EMAIL_SIGNOFFS = {
+    "fr": "Cordialement,", "en": "Best regards,", "es": "Saludos cordiales,",
+    "de": "Mit freundlichen Grüßen,", "it": "Cordiali saluti,", "pt": "Atenciosamente,",
+    "nl": "Met vriendelijke groet,", "pl": "Z poważaniem,", "ru": "С уважением,",
+    "zh": "此致敬礼，", "ja": "よろしくお願いいたします。", "ko": "감사합니다.",
+    "ar": "مع التحية，", "hi": "धन्यवाद,", "tr": "Saygılarımla,", "sv": "Med vänliga hälsningar,",
+    "da": "Med venlig hilsen,", "no": "Med vennlig hilsen,", "fi": "Ystävällisin terveisin,",
+    "cs": "S pozdravem,", "hu": "Üdvözlettel,", "el": "Με εκτίμηση,", "he": "בברכה,",
+    "th": "ด้วยความเคารพ,", "vi": "Trân trọng,", "id": "Hormat saya,", "ms": "Yang benar,",
+    "uk": "З повагою,", "ro": "Cu stimă,"
+}
+
+LATEX_SYSTEM_PROMPT = (
+    "You are a highly accurate audio-to-LaTeX converter. "
+    "Convert the user's spoken math dictation into clean, valid LaTeX code. "
+    "Output ONLY the raw LaTeX code. Do not include markdown formatting like ```latex. "
+    "Do not include any explanations, greetings, or filler text. "
+    "Distinguish carefully between spoken words meant for the equation and conversational filler. "
+    "Do not wrap the output in \\[ or $$ unless explicitly requested by the user."
+)
+
+
+def has_speech(pcm_data: bytes, min_voiced_sec: float = VAD_MIN_VOICED_SEC) -> bool:
+    """Cheap energy gate so effectively silent recordings are never uploaded; short words still pass."""
+    samples = np.frombuffer(pcm_data, dtype=np.int16)
+    frame_count = len(samples) // VAD_FRAME_SAMPLES
+    if frame_count == 0:
+        return False
+    frames = samples[:frame_count * VAD_FRAME_SAMPLES].reshape(frame_count, VAD_FRAME_SAMPLES)
+    rms = np.sqrt(np.mean(frames.astype(np.float32) ** 2, axis=1))
+    noise_floor = float(np.percentile(rms, VAD_NOISE_FLOOR_PERCENTILE))
+    threshold = min(VAD_RMS_THRESHOLD, max(VAD_RMS_FLOOR, noise_floor * VAD_NOISE_FLOOR_RATIO))
+    voiced_sec = np.count_nonzero(rms > threshold) * VAD_FRAME_SAMPLES / AppConfig.AUDIO_RATE
+    logger.debug(
+        "VAD | noise floor: %.1f | peak: %.1f | threshold: %.1f | voiced: %.2fs",
+        noise_floor, float(rms.max()), threshold, voiced_sec
+    )
+    return voiced_sec >= min_voiced_sec
+
+
+@lru_cache(maxsize=16)
+def build_transcription_prompt(preset: str, vocabulary: str) -> str:
+    """Preset hint plus vocabulary, capped to the prompt budget; only rebuilt when either changes."""
+    prompt = PRESET_PROMPTS.get(preset, "")
+    if vocabulary:
+        prompt = prompt + " Vocabulary: " + vocabulary + "." if prompt else vocabulary
+    return prompt[:PROMPT_MAX_CHARS]
+
 
 class AudioManager:
     def __init__(self, app_state, sound_manager, event_bus, mode_manager=None, credential_manager=None):
@@ -120,24 +219,22 @@ class AudioManager:
 
         self.app_state.is_busy = True
         self.app_state.audio.is_recording = True
-        self.app_state.audio.recording_start_time = time.time()
-
-        temp_dir = Path(tempfile.gettempdir()).resolve()
-        temp_path = temp_dir / f"ozmoz_rec_{uuid.uuid4().hex}.wav"
-        self.app_state.audio.current_recording_path = str(temp_path)
+        self.app_state.audio.recording_start_time = time.monotonic()
+        self.app_state.audio.current_recording = None
 
         self._recording_thread = threading.Thread(
-            target=self._record_audio_worker, args=(str(temp_path),), daemon=True
+            target=self._record_audio_worker, daemon=True
         )
         self._recording_thread.start()
 
-    def _record_audio_worker(self, filename: str) -> None:
-        frames = []
+    def _record_audio_worker(self) -> None:
+        # One growing buffer instead of a list of 1 KB chunks joined (and copied) again on stop.
+        frames = bytearray()
         try:
             stream = self._audio_stream
             while self.app_state.audio.is_recording:
                 data = stream.read(AppConfig.AUDIO_CHUNK, exception_on_overflow=False)
-                frames.append(data)
+                frames += data
 
                 self.event_bus.publish("audio_frame", data, threaded=False)
         except Exception:
@@ -148,52 +245,86 @@ class AudioManager:
                 self._audio_stream.close()
                 self._audio_stream = None
             if frames:
-                self._write_wav_file(filename, frames)
-
-    def _write_wav_file(self, filename: str, frames: list) -> None:
-        try:
-            with wave.open(filename, "wb") as wave_file:
-                wave_file.setnchannels(AppConfig.AUDIO_CHANNELS)
-                wave_file.setsampwidth(self._pyaudio_instance.get_sample_size(AppConfig.AUDIO_FORMAT))
-                wave_file.setframerate(AppConfig.AUDIO_RATE)
-                wave_file.writeframes(b"".join(frames))
-        except Exception:
-            logger.exception(f"Failed to write audio to {filename}")
+                self.app_state.audio.current_recording = frames
 
     def wait_for_recording(self, timeout: float = 5.0) -> None:
-        if self._recording_thread and self._recording_thread.is_alive():
+        if self._recording_thread:
             self._recording_thread.join(timeout=timeout)
         self._recording_thread = None
 
 
 class TranscriptionService:
-    def __init__(self, app_state, credential_manager, vocabulary_manager=None, mode_manager=None):
+    def __init__(self, app_state, credential_manager, vocabulary_manager=None, mode_manager=None,
+                 event_bus=None):
         self.app_state = app_state
         self.credential_manager = credential_manager
         self.vocabulary_manager = vocabulary_manager
         self.mode_manager = mode_manager
         self._groq_client = None
         self._last_api_key = None
+        self._last_groq_request = 0.0
+
+        if event_bus:
+            event_bus.subscribe("recording_started", self.prewarm)
 
     def _get_groq_client(self):
         api_key = self.credential_manager.get_api_key("groq")
         if not api_key:
             return None
         if self._groq_client is None or api_key != self._last_api_key:
-            self._groq_client = Groq(api_key=api_key)
+            # Deferred off the main thread: the SDK, httpx and pydantic imports run in warm_up() on the
+            # TranscriptionWarmup thread at launch, so the UI starts without waiting on them.
+            import httpx
+            from groq import DEFAULT_CONNECTION_LIMITS, DefaultHttpxClient, Groq
+
+            limits = httpx.Limits(
+                max_connections=DEFAULT_CONNECTION_LIMITS.max_connections,
+                max_keepalive_connections=DEFAULT_CONNECTION_LIMITS.max_keepalive_connections,
+                keepalive_expiry=GROQ_KEEPALIVE_SEC,
+            )
+            self._groq_client = Groq(api_key=api_key, http_client=DefaultHttpxClient(limits=limits))
             self._last_api_key = api_key
+            self._last_groq_request = 0.0
         return self._groq_client
 
-    def transcribe(self, filename: str, duration: float) -> str:
-        if not os.path.exists(filename):
-            return "⚠️ Error: Audio file not found."
+    def warm_up(self) -> None:
+        """Launch-time warm-up: pays the import and client costs without touching the network or a model."""
+        # A probe sent now would idle out before the first hotkey press, and a local model loaded now
+        # would stay in memory even if the user never dictates; both are left to prewarm().
+        try:
+            ui_model = self.mode_manager.get_mode("system").get("active_model", "Whisper V3 Turbo")
+            if "Local" in ui_model:
+                local_whisper.import_runtime()
+            else:
+                self._get_groq_client()
+        except Exception:
+            logger.debug("Transcription engine warm-up failed", exc_info=True)
+
+    def prewarm(self, data=None) -> None:
+        """Readies the active engine while the user is still speaking."""
+        try:
+            ui_model = self.mode_manager.get_mode("system").get("active_model", "Whisper V3 Turbo")
+            if "Local" in ui_model:
+                local_whisper.load(ui_model)
+            else:
+                client = self._get_groq_client()
+                if client and time.monotonic() - self._last_groq_request > GROQ_PREWARM_SKIP_SEC:
+                    # Opens the pooled HTTPS connection so the upload skips the TCP/TLS handshake.
+                    client.with_options(timeout=5.0, max_retries=0).models.list()
+                    self._last_groq_request = time.monotonic()
+        except Exception:
+            logger.debug("Transcription engine prewarm failed", exc_info=True)
+
+    def transcribe(self, pcm_data: bytes, duration: float, model_name: Optional[str] = None) -> str:
+        if not pcm_data:
+            return "⚠️ Error: No audio recorded."
 
         try:
             sys_cfg = self.mode_manager.get_mode("system")
             ui_preset = sys_cfg.get("active_preset", "Voice to text")
             lang_name = sys_cfg.get("active_language", "English").lower()
             lang_iso = LANGUAGES_ISO.get(lang_name, "en")
-            ui_model = sys_cfg.get("active_model", "Whisper V3 Turbo")
+            ui_model = model_name or sys_cfg.get("active_model", "Whisper V3 Turbo")
             api_model = GROQ_MODEL_MAPPING.get(ui_model, "whisper-large-v3-turbo")
 
             if ui_model == "Select a model...":
@@ -208,32 +339,8 @@ class TranscriptionService:
                 ui_preset, ui_model, lang_iso
             )
 
-            if ui_preset == "Email Draft":
-                prompt = (
-                    "Transcribe this audio as a professional email. "
-                    "Use formal language, proper punctuation, and clear paragraph structure. "
-                    "Do not include filler words, silence markers, or meta-text like 'Subtitles by...'. "
-                    "Format with a greeting, body paragraphs, and a sign-off."
-                )
-            elif ui_preset == "Equation":
-                prompt = (
-                    "Math dictation. Symbols, equations, variables, Greek letters, "
-                    "fractions, integrals, superscripts, subscripts. "
-                    "Example: integral from zero to infinity of x squared dx equals pi."
-                )
-            else:
-                prompt = ""
-
-            if self.vocabulary_manager:
-                words = self.vocabulary_manager.get_words()
-                if words:
-                    if prompt:
-                        prompt += " Vocabulary: " + ", ".join(words) + "."
-                    else:
-                        prompt = ", ".join(words)
-
-            if len(prompt) > 500:
-                prompt = prompt[:500]
+            vocabulary = self.vocabulary_manager.get_prompt_text() if self.vocabulary_manager else ""
+            prompt = build_transcription_prompt(ui_preset, vocabulary)
 
             result = ""
 
@@ -243,20 +350,22 @@ class TranscriptionService:
                     return f"⚠️ Error: Model '{ui_model}' is not installed."
 
                 result = local_whisper.transcribe(
-                    filename, language=lang_iso, model_name=ui_model, prompt=prompt
+                    pcm_data, language=lang_iso, model_name=ui_model, prompt=prompt
                 )
             else:
+                # The local engine already runs faster-whisper's vad_filter, so only the upload is gated.
+                if not has_speech(pcm_data):
+                    logger.info("No speech detected in %.1fs recording, skipping upload", duration)
+                    return "⚠️ Error: No audio or result detected (silence or noise)."
+
                 logger.info("Sending audio to CLOUD engine (Groq API)...")
                 client = self._get_groq_client()
                 if not client:
                     return "⚠️ Error: Groq API key missing."
 
-                with open(filename, "rb") as file_obj:
-                    audio_content = file_obj.read()
-
                 kwargs = {
                     "model": api_model,
-                    "file": (Path(filename).name, audio_content),
+                    "file": ("recording.wav", self._encode_wav(pcm_data)),
                     "response_format": "verbose_json",
                     "temperature": 0.0
                 }
@@ -266,6 +375,7 @@ class TranscriptionService:
                     kwargs["prompt"] = prompt
 
                 transcription = client.audio.transcriptions.create(**kwargs)
+                self._last_groq_request = time.monotonic()
 
                 valid_text = []
                 segments = None
@@ -298,9 +408,11 @@ class TranscriptionService:
                 else:
                     result = getattr(transcription, "text", str(transcription)).strip()
 
-                word_count = len(re.findall(r'\w+', result))
-                if duration > 4.0 and word_count <= 2:
-                    result = ""
+                if duration > 4.0:
+                    # Only whether a third word exists matters, so stop scanning there.
+                    word_count = sum(1 for _ in islice(WORD_PATTERN.finditer(result), 3))
+                    if word_count <= 2:
+                        result = ""
 
             if not result:
                 return "⚠️ Error: No audio or result detected (silence or noise)."
@@ -316,6 +428,17 @@ class TranscriptionService:
             logger.exception("Internal transcription error")
             return f"❌ Internal error during transcription: {e}"
 
+    def _encode_wav(self, pcm_data: bytes) -> io.BytesIO:
+        """Wraps the PCM in a WAV header; the rewound buffer is handed to the upload as a file."""
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wave_file:
+            wave_file.setnchannels(AppConfig.AUDIO_CHANNELS)
+            wave_file.setsampwidth(pyaudio.get_sample_size(AppConfig.AUDIO_FORMAT))
+            wave_file.setframerate(AppConfig.AUDIO_RATE)
+            wave_file.writeframes(pcm_data)
+        buffer.seek(0)
+        return buffer
+
     def _convert_to_latex(self, text: str) -> str:
         text = text.strip()
         if not text:
@@ -325,24 +448,16 @@ class TranscriptionService:
         if not client:
             return "⚠️ Error: Groq API key missing for Equation mode."
 
-        system_prompt = (
-            "You are a highly accurate audio-to-LaTeX converter. "
-            "Convert the user's spoken math dictation into clean, valid LaTeX code. "
-            "Output ONLY the raw LaTeX code. Do not include markdown formatting like ```latex. "
-            "Do not include any explanations, greetings, or filler text. "
-            "Distinguish carefully between spoken words meant for the equation and conversational filler. "
-            "Do not wrap the output in \\[ or $$ unless explicitly requested by the user."
-        )
-
         try:
             chat_completion = client.chat.completions.create(
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": LATEX_SYSTEM_PROMPT},
                     {"role": "user", "content": text}
                 ],
                 model="llama-3.1-8b-instant",
                 temperature=0.0,
             )
+            self._last_groq_request = time.monotonic()
             latex_result = chat_completion.choices[0].message.content.strip()
 
             if latex_result.startswith("```latex"):
@@ -362,7 +477,7 @@ class TranscriptionService:
         if not text:
             return text
 
-        sentences = [s.strip() for s in re.split(r'(?<=[.!?])\s+', text) if s.strip()]
+        sentences = [s.strip() for s in SENTENCE_SPLIT_PATTERN.split(text) if s.strip()]
         if not sentences:
             return text
 
@@ -408,30 +523,10 @@ class TranscriptionService:
         return "\n\n".join(parts)
 
     def _default_greeting(self, lang_iso: str) -> str:
-        greetings = {
-            "fr": "Bonjour,", "en": "Hello,", "es": "Hola,", "de": "Hallo,",
-            "it": "Buongiorno,", "pt": "Olá,", "nl": "Hallo,", "pl": "Dzień dobry,",
-            "ru": "Здравствуйте,", "zh": "您好，", "ja": "こんにちは、", "ko": "안녕하세요,",
-            "ar": "مرحباً،", "hi": "नमस्ते,", "tr": "Merhaba,", "sv": "Hej,",
-            "da": "Hej,", "no": "Hei,", "fi": "Hei,", "cs": "Dobrý den,",
-            "hu": "Tisztelt Címzett!", "el": "Γεια σας,", "he": "שלום,", "th": "สวัสดีครับ/ค่ะ,",
-            "vi": "Xin chào,", "id": "Halo,", "ms": "Helo,", "uk": "Вітаю,", "ro": "Bună ziua,"
-        }
-        return greetings.get(lang_iso, "Hello,")
+        return EMAIL_GREETINGS.get(lang_iso, "Hello,")
 
     def _default_signoff(self, lang_iso: str) -> str:
-        signoffs = {
-            "fr": "Cordialement,", "en": "Best regards,", "es": "Saludos cordiales,",
-            "de": "Mit freundlichen Grüßen,", "it": "Cordiali saluti,", "pt": "Atenciosamente,",
-            "nl": "Met vriendelijke groet,", "pl": "Z poważaniem,", "ru": "С уважением,",
-            "zh": "此致敬礼，", "ja": "よろしくお願いいたします。", "ko": "감사합니다.",
-            "ar": "مع التحية，", "hi": "धन्यवाद,", "tr": "Saygılarımla,", "sv": "Med vänliga hälsningar,",
-            "da": "Med venlig hilsen,", "no": "Med vennlig hilsen,", "fi": "Ystävällisin terveisin,",
-            "cs": "S pozdravem,", "hu": "Üdvözlettel,", "el": "Με εκτίμηση,", "he": "בברכה,",
-            "th": "ด้วยความเคารพ,", "vi": "Trân trọng,", "id": "Hormat saya,", "ms": "Yang benar,",
-            "uk": "З повагою,", "ro": "Cu stimă,"
-        }
-        return signoffs.get(lang_iso, "Best regards,")
+        return EMAIL_SIGNOFFS.get(lang_iso, "Best regards,")
 
     def _format_body_paragraphs(self, sentences: list, lang_iso: str) -> list:
         if not sentences:
@@ -440,20 +535,11 @@ class TranscriptionService:
         paragraphs = []
         current_para = []
 
-        transition_patterns = [
-            r'^(however|nevertheless|furthermore|moreover|additionally|consequently|therefore|meanwhile|alternatively|specifically|finally|in\s+conclusion|to\s+conclude|on\s+the\s+other\s+hand|firstly|secondly|thirdly)',
-            r'^(cependant|néanmoins|par\s+ailleurs|de\s+plus|ensuite|enfin|en\s+conclusion|d\'autre\s+part|toutefois|premièrement|deuxièmement)',
-            r'^(sin\s+embargo|además|por\s+lo\s+tanto|en\s+conclusión|por\s+outro\s+lado|finalmente)',
-            r'^(jedoch|außerdem|darüber\s+hinaus|zusammenfassend|schließlich|andererseits)',
-            r'^(tuttavia|inoltre|pertanto|in\s+conclusione|d\'alta\s+parte|infine)',
-            r'^(no\s+entanto|além\s+disso|portanto|em\s+conclusão|por\s+outro\s+lado|finalmente)',
-        ]
-
         para_size_target = 2
 
         for i, sentence in enumerate(sentences):
             sent_lower = sentence.lower().strip()
-            is_transition = any(re.search(pattern, sent_lower) for pattern in transition_patterns)
+            is_transition = TRANSITION_PATTERN.match(sent_lower) is not None
 
             if (is_transition and current_para) or len(current_para) >= para_size_target:
                 paragraphs.append(" ".join(current_para))
@@ -495,7 +581,7 @@ class TranscriptionManager:
         tracker = PerfTracker("Transcription Flow")
         tracker.step("Hotkey released")
 
-        audio_duration = time.time() - self.app_state.audio.recording_start_time
+        audio_duration = time.monotonic() - self.app_state.audio.recording_start_time
 
         try:
             self._previous_active_window = win32gui.GetForegroundWindow()
@@ -512,24 +598,21 @@ class TranscriptionManager:
                 self.app_state.audio.is_recording = False
                 self.audio_manager.wait_for_recording()
 
-                wav_file = self.app_state.audio.current_recording_path
-
-                if wav_file and os.path.exists(wav_file):
-                    audio_file_to_send = wav_file
+                pcm_data = self.app_state.audio.current_recording
+                self.app_state.audio.current_recording = None
 
-                    start_process_time = time.time()
+                if pcm_data:
+                    # Resolved once so the history label names the model that actually transcribed.
+                    ui_model = self.transcription_service.mode_manager.get_mode("system").get(
+                        "active_model", "Whisper V3 Turbo"
+                    )
+                    start_process_time = time.monotonic()
                     text = self.transcription_service.transcribe(
-                        audio_file_to_send, duration=audio_duration
+                        pcm_data, duration=audio_duration, model_name=ui_model
                     )
-                    processing_time = time.time() - start_process_time
-
-                    if os.path.exists(audio_file_to_send):
-                        os.remove(audio_file_to_send)
-
-                    if not (text.startswith("⚠️") or text.startswith("❌")):
-                        sys_cfg = self.transcription_service.mode_manager.get_mode("system")
-                        ui_model = sys_cfg.get("active_model", "Whisper V3 Turbo")
+                    processing_time = time.monotonic() - start_process_time
 
+                    if not text.startswith(("⚠️", "❌")):
                         if "Local" in ui_model:
                             used_method = f"local-{ui_model.replace(' ', '-').lower()}"
                         else:
@@ -550,19 +633,22 @@ class TranscriptionManager:
 
                         if self._previous_active_window:
                             try:
-                                win32gui.SetForegroundWindow(self._previous_active_window)
-                                time.sleep(0.15)
+                                # The activation settle delay is only needed when focus actually moved.
+                                if win32gui.GetForegroundWindow() != self._previous_active_window:
+                                    win32gui.SetForegroundWindow(self._previous_active_window)
+                                    time.sleep(0.15)
                             except Exception:
                                 logger.debug("Failed to set foreground window", exc_info=True)
 
                         self.clipboard_manager.paste_and_clear(text)
 
             except Exception as e:
-                logger.error(f"FATAL THREAD ERROR: {e}")
+                logger.error("FATAL THREAD ERROR: %s", e)
             finally:
-                self.event_bus.publish("processing_finished", None)
+                # Release the flags before notifying, so a hotkey pressed as the UI turns idle is accepted.
                 self.app_state.is_busy = False
                 self._is_stopping = False
+                self.event_bus.publish("processing_finished", None)
                 tracker.step("Process finished (cleaned up)")
 
         global_executor.submit(_process_transcription)
\ No newline at end of file
@@ -6,18 +6,22 @@ os.environ["HF_HUB_DISABLE_TELEMETRY"] = "1"
 warnings.filterwarnings("ignore", category=UserWarning, module="huggingface_hub")
 
 import gc
+import importlib
 import logging
 import shutil
 import sys
 import threading
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
+import numpy as np
 import requests
-from faster_whisper import WhisperModel
 
 from src.core.utils import PathManager
 
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
 DOWNLOAD_CHUNK_SIZE = 16384
 DOWNLOAD_TIMEOUT_SECONDS = 30
 
@@ -51,11 +55,19 @@ class LocalWhisperManager:
     def __init__(self) -> None:
         root_dir = Path(__file__).resolve().parent.parent.parent
         self.base_models_directory: Path = root_dir / "data" / "models"
+        self._model_directories: dict[str, Path] = {
+            name: self._resolve_model_directory(name) for name in MODELS_CONFIG
+        }
 
-        self.model_instance: Optional[WhisperModel] = None
+        self.model_instance: Optional["WhisperModel"] = None
         self.is_loading: bool = False
         self._lock: threading.Lock = threading.Lock()
+        self._load_lock: threading.Lock = threading.Lock()
         self._current_loaded_model_name: Optional[str] = None
+        # Only positive checks are cached, so a model copied into data/models by hand is picked up on the
+        # next check. Download, delete and failed loads invalidate under _lock and bump the generation.
+        self._installed_cache: set[str] = set()
+        self._installed_generation: int = 0
         self.has_cuda: bool = False
         self._detect_cuda_support()
 
@@ -65,10 +77,14 @@ class LocalWhisperManager:
         except Exception:
             logger.exception("Failed to create models directory")
 
-    def _get_model_directory(self, model_name: str) -> Path:
+    def _resolve_model_directory(self, model_name: str) -> Path:
         safe_name = model_name.replace(" ", "_").lower()
         return (self.base_models_directory / safe_name).resolve()
 
+    def _get_model_directory(self, model_name: str) -> Path:
+        model_dir = self._model_directories.get(model_name)
+        return model_dir if model_dir is not None else self._resolve_model_directory(model_name)
+
     def setup_portable_cuda(self) -> None:
         try:
             site_packages = next((p for p in sys.path if "site-packages" in p and os.path.isdir(p)), None)
@@ -97,15 +113,33 @@ class LocalWhisperManager:
             logger.debug("Detect CUDA support failed", exc_info=True)
 
     def is_installed(self, model_name: str) -> bool:
+        with self._lock:
+            if model_name in self._installed_cache:
+                return True
+            generation = self._installed_generation
+
+        installed = self._check_installed(model_name)
+        if installed:
+            with self._lock:
+                # A download or delete that ran during the check makes its result stale.
+                if generation == self._installed_generation and not self.is_loading:
+                    self._installed_cache.add(model_name)
+        return installed
+
+    def _invalidate_installed(self, model_name: str) -> None:
+        with self._lock:
+            self._installed_cache.discard(model_name)
+            self._installed_generation += 1
+
+    def _check_installed(self, model_name: str) -> bool:
         try:
             model_dir = self._get_model_directory(model_name)
-            if not model_dir.exists():
-                return False
             for file_name in MODELS_CONFIG[model_name]["files"]:
-                f_path = model_dir / file_name
-                if not f_path.exists() or f_path.stat().st_size < 100:
+                if (model_dir / file_name).stat().st_size < 100:
                     return False
             return True
+        except FileNotFoundError:
+            return False
         except Exception:
             logger.debug("is_installed failed to check", exc_info=True)
             return False
@@ -121,7 +155,9 @@ class LocalWhisperManager:
             self.is_loading = True
 
         logger.info("Starting download: %s", model_name)
+        self._invalidate_installed(model_name)
 
+        session = None
         try:
             model_config = MODELS_CONFIG[model_name]
             repo_id = model_config["repo_id"]
@@ -129,11 +165,14 @@ class LocalWhisperManager:
             target_dir.mkdir(parents=True, exist_ok=True)
             files_to_download = model_config["files"]
 
+            # One pooled session so the HEAD probes and file downloads reuse a kept-alive connection.
+            session = requests.Session()
+
             total_expected_bytes = 0
             for filename in files_to_download:
                 url = f"https://{ALLOWED_DOWNLOAD_DOMAIN}/{repo_id}/resolve/main/{filename}"
                 try:
-                    resp = requests.head(url, timeout=10, allow_redirects=True)
+                    resp = session.head(url, timeout=10, allow_redirects=True)
                     total_expected_bytes += int(resp.headers.get("Content-Length", 0))
                 except Exception:
                     pass
@@ -167,7 +206,7 @@ class LocalWhisperManager:
                 if existing_size > 0:
                     headers["Range"] = f"bytes={existing_size}-"
 
-                response = requests.get(
+                response = session.get(
                     url, headers=headers, stream=True,
                     timeout=DOWNLOAD_TIMEOUT_SECONDS, allow_redirects=True
                 )
@@ -199,10 +238,23 @@ class LocalWhisperManager:
             logger.exception("Download failed: %s", model_name)
             return False
         finally:
+            if session is not None:
+                session.close()
             with self._lock:
+                self._installed_cache.discard(model_name)
+                self._installed_generation += 1
                 self.is_loading = False
 
+    def import_runtime(self) -> None:
+        """Imports faster-whisper ahead of the first load without reading any model weights."""
+        importlib.import_module("faster_whisper")
+
     def load(self, model_name: str) -> bool:
+        # Serialized so a prewarm started at recording time and the transcription never load twice.
+        with self._load_lock:
+            return self._load(model_name)
+
+    def _load(self, model_name: str) -> bool:
         if not self.is_installed(model_name):
             logger.warning("Cannot load, %s is not fully downloaded.", model_name)
             return False
@@ -213,6 +265,9 @@ class LocalWhisperManager:
         self.model_instance = None
         gc.collect()
         self.setup_portable_cuda()
+
+        # Deferred: faster-whisper pulls in CTranslate2, tokenizers and PyAV, which cloud-only users never need.
+        from faster_whisper import WhisperModel
         model_dir = self._get_model_directory(model_name)
 
         logger.info("Loading model into memory: %s", model_name)
@@ -239,10 +294,11 @@ class LocalWhisperManager:
             return True
         except Exception:
             logger.exception("Failed to load model on CPU")
+            self._invalidate_installed(model_name)
             return False
 
     def transcribe(
-        self, audio_file_path: str, language: str = "en",
+        self, pcm_data: bytes, language: str = "en",
         model_name: str = "Local Whisper Base", prompt: str = ""
     ) -> str:
         if not self.load(model_name):
@@ -250,8 +306,10 @@ class LocalWhisperManager:
 
         logger.info("Local transcription in progress...")
         try:
+            # Recordings are already 16 kHz mono int16, the waveform format faster-whisper expects.
+            audio = np.frombuffer(pcm_data, dtype=np.int16).astype(np.float32) / 32768.0
             segments, info = self.model_instance.transcribe(
-                audio_file_path,
+                audio,
                 language=language if language != "autodetect" else None,
                 initial_prompt=prompt,
                 vad_filter=True,
@@ -277,14 +335,16 @@ class LocalWhisperManager:
             gc.collect()
 
         try:
-            target_dir = self._get_model_directory(model_name)
-            if target_dir.exists():
-                shutil.rmtree(target_dir)
-                logger.info("Model %s deleted successfully", model_name)
+            shutil.rmtree(self._get_model_directory(model_name))
+            logger.info("Model %s deleted successfully", model_name)
+            return True
+        except FileNotFoundError:
             return True
         except Exception:
             logger.exception("Failed to delete %s", model_name)
             return False
+        finally:
+            self._invalidate_installed(model_name)
 
 
 local_whisper = LocalWhisperManager()
\ No newline at end of file
@@ -48,7 +48,7 @@ class ThreadingState:
 class AudioState:
     pyaudio_instance: Optional[pyaudio.PyAudio] = None
     is_recording: bool = False
-    current_recording_path: Optional[str] = None
+    current_recording: Optional[bytearray] = None
     recording_start_time: float = 0.0
     sound_enabled: bool = True
 
@@ -2,8 +2,11 @@ import sys
 import base64
 import json
 import logging
+import queue
+import threading
 import uuid
 import win32crypt
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
@@ -14,6 +17,7 @@ from src.core.utils import PathManager, atomic_write_json
 logger = logging.getLogger(__name__)
 
 DPAPI_ENTROPY = b"Ozmoz_DPAPI_Salt_2026!_"
+HISTORY_MAX_ENTRIES = 5000
 
 
 def get_portable_data_dir() -> Path:
@@ -32,33 +36,44 @@ class CredentialManager:
 
     def __init__(self):
         self.filepath = get_portable_data_dir() / "credentials.json"
+        self._key_cache: dict[str, Optional[str]] = {}
         if not self.filepath.exists():
             atomic_write_json(self.filepath, {})
 
     def get_api_key(self, service: str) -> Optional[str]:
+        # Decrypting means a file read plus a DPAPI call; keys only change through save_api_key.
+        if service in self._key_cache:
+            return self._key_cache[service]
+        key, cacheable = self._load_api_key(service)
+        if cacheable:
+            self._key_cache[service] = key
+        return key
+
+    def _load_api_key(self, service: str) -> tuple[Optional[str], bool]:
+        """Returns the key and whether it is a settled outcome; transient read/DPAPI failures are retried."""
         try:
             data = json.loads(self.filepath.read_text(encoding="utf-8"))
             encrypted_key = data.get(service)
             if not encrypted_key:
-                return None
+                return None, True
             
             try:
                 decoded = base64.b64decode(encrypted_key)
                 decrypted = win32crypt.CryptUnprotectData(decoded, DPAPI_ENTROPY, None, None, 0)[1]
-                return decrypted.decode('utf-8')
+                return decrypted.decode('utf-8'), True
             except pywintypes.error as e:
                 # Si erreur 13 (Données non valides), c'est une ancienne clé sans entropie
                 if getattr(e, 'winerror', 0) == 13 or (isinstance(e.args, tuple) and e.args[0] == 13):
                     logger.info("Legacy key format detected for %s. The key must be re-entered in the settings.", service)
-                else:
-                    logger.debug("Minor DPAPI error: %s", e)
-                return None
+                    return None, True
+                logger.debug("Minor DPAPI error: %s", e)
+                return None, False
             except Exception:
                 logger.debug("Failed to decrypt API key for service: %s", service, exc_info=True)
-                return None
+                return None, False
         except Exception:
             logger.debug("Credentials file is missing or corrupted.")
-            return None
+            return None, False
 
     def save_api_key(self, service: str, key: str) -> None:
         try:
@@ -76,6 +91,7 @@ class CredentialManager:
             data[service] = ""
 
         atomic_write_json(self.filepath, data)
+        self._key_cache[service] = key or None
 
 
 class HistoryManager:
@@ -84,16 +100,43 @@ class HistoryManager:
     def __init__(self, event_bus=None):
         self.filepath = get_portable_data_dir() / "history.json"
         self.event_bus = event_bus
+        self._lock = threading.Lock()
         if not self.filepath.exists():
             atomic_write_json(self.filepath, [])
+        # Bounded so the oldest entry is evicted in O(1) once the cap is reached.
+        self._entries: deque = deque(self._load(), maxlen=HISTORY_MAX_ENTRIES)
 
-    def add_entry(self, text: str, duration_sec: float, processing_sec: float, method: str) -> None:
+        # Writes happen off the transcription path; bursts collapse into one file write.
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, daemon=True, name="HistoryWriter"
+        )
+        self._writer_thread.start()
+
+    def _load(self) -> list:
         try:
             data = json.loads(self.filepath.read_text(encoding="utf-8"))
+            return data if isinstance(data, list) else []
         except Exception:
             logger.debug("History file corrupted or missing, resetting.", exc_info=True)
-            data = []
+            return []
+
+    def _writer_loop(self) -> None:
+        stop = False
+        while not stop:
+            stop = self._write_queue.get() is None
+            while not self._write_queue.empty():
+                stop = self._write_queue.get_nowait() is None or stop
+            with self._lock:
+                snapshot = list(self._entries)
+            atomic_write_json(self.filepath, snapshot)
+
+    def _changed(self) -> None:
+        self._write_queue.put_nowait(True)
+        if self.event_bus:
+            self.event_bus.publish("history_updated", None)
 
+    def add_entry(self, text: str, duration_sec: float, processing_sec: float, method: str) -> None:
         entry = {
             "id": str(uuid.uuid4()),
             "timestamp": datetime.now().isoformat(),
@@ -103,32 +146,33 @@ class HistoryManager:
             "processing_time_sec": round(processing_sec, 2),
             "method": method
         }
-        data.append(entry)
-        if len(data) > 5000:
-            data = data[-5000:]
-
-        atomic_write_json(self.filepath, data)
-
-        if self.event_bus:
-            self.event_bus.publish("history_updated", None)
+        with self._lock:
+            self._entries.append(entry)
+        self._changed()
 
     def delete_entry(self, entry_id: str) -> None:
-        try:
-            data = json.loads(self.filepath.read_text(encoding="utf-8"))
-            new_data = [item for item in data if item.get("id") != entry_id]
+        with self._lock:
+            new_entries = deque(
+                (item for item in self._entries if item.get("id") != entry_id), maxlen=HISTORY_MAX_ENTRIES
+            )
+            deleted = len(new_entries) != len(self._entries)
+            self._entries = new_entries
+        if deleted:
+            self._changed()
 
-            if len(new_data) != len(data):
-                atomic_write_json(self.filepath, new_data)
-                if self.event_bus:
-                    self.event_bus.publish("history_updated", None)
-        except Exception:
-            logger.exception("Failed to delete history entry")
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        self._changed()
 
     def get_all(self) -> list:
-        try:
-            return json.loads(self.filepath.read_text(encoding="utf-8"))
-        except Exception:
-            return []
+        with self._lock:
+            return list(self._entries)
+
+    def close(self) -> None:
+        """Flushes pending writes; called once on application shutdown."""
+        self._write_queue.put_nowait(None)
+        self._writer_thread.join(timeout=5.0)
 
 
 class StatsManager:
@@ -137,8 +181,9 @@ class StatsManager:
     def __init__(self, history_manager: HistoryManager):
         self.history_manager = history_manager
 
-    def get_home_stats(self) -> dict:
-        history = self.history_manager.get_all()
+    def get_home_stats(self, history: Optional[list] = None) -> dict:
+        if history is None:
+            history = self.history_manager.get_all()
         now = datetime.now()
         one_week_ago = now - timedelta(days=7)
 
@@ -16,6 +16,8 @@ DEFAULT_MODES = {
     }
 }
 
+BUILTIN_MODE_IDS = frozenset({"default", "system"})
+
 
 class ModeManager:
     """Manages the storage and reading of mode configurations (e.g., Default mode)."""
@@ -31,7 +33,7 @@ class ModeManager:
             try:
                 self._modes = json.loads(self.filepath.read_text(encoding="utf-8"))
             except Exception as e:
-                logger.error(f"Error reading modes.json: {e}", exc_info=True)
+                logger.error("Error reading modes.json: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
                 self._modes = DEFAULT_MODES.copy()
         else:
             self._modes = DEFAULT_MODES.copy()
@@ -47,13 +49,22 @@ class ModeManager:
         return self._modes.get(mode_id, DEFAULT_MODES["default"])
 
     def update_mode(self, mode_id, key, value):
+        self._apply_mode_values(mode_id, {key: value})
+        if self.event_bus:
+            self.event_bus.publish("mode_updated", {"mode_id": mode_id, "key": key, "value": value})
+
+    def update_mode_values(self, mode_id, values):
+        """Applies several keys at once with a single save and a single notification."""
+        self._apply_mode_values(mode_id, values)
+        if self.event_bus:
+            self.event_bus.publish("mode_updated", {"mode_id": mode_id, "values": values})
+
+    def _apply_mode_values(self, mode_id, values):
         if mode_id not in self._modes:
             self._modes[mode_id] = DEFAULT_MODES["default"].copy()
             self._modes[mode_id]["name"] = mode_id
-        self._modes[mode_id][key] = value
+        self._modes[mode_id].update(values)
         self.save()
-        if self.event_bus:
-            self.event_bus.publish("mode_updated", {"mode_id": mode_id, "key": key, "value": value})
 
     def add_mode(self, mode_id, name, preset, language, voice_model):
         self._modes[mode_id] = {
@@ -67,11 +78,11 @@ class ModeManager:
             self.event_bus.publish("mode_updated", {"mode_id": mode_id, "created": True})
 
     def delete_mode(self, mode_id):
-        if mode_id in self._modes and mode_id not in ["default", "system"]:
+        if mode_id in self._modes and mode_id not in BUILTIN_MODE_IDS:
             del self._modes[mode_id]
             self.save()
             if self.event_bus:
                 self.event_bus.publish("mode_updated", {"mode_id": mode_id, "deleted": True})
 
     def get_custom_modes(self):
-        return {k: v for k, v in self._modes.items() if k not in ["default", "system"]}
\ No newline at end of file
+        return {k: v for k, v in self._modes.items() if k not in BUILTIN_MODE_IDS}
\ No newline at end of file
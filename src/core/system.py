@@ -56,7 +56,7 @@ class DualModeHotKey:
         return key
 
     def press(self, key: PynputKey) -> None:
-        now = time.time()
+        now = time.monotonic()
         self._currently_pressed_keys = {
             k: ts for k, ts in self._currently_pressed_keys.items() if now - ts < 5.0
         }
@@ -13,7 +13,6 @@ import pywintypes
 from pathlib import Path
 from typing import IO, Optional
 
-from pydub import AudioSegment
 from pynput.keyboard import Controller as KeyboardController, Key
 
 from src.core.system import global_executor
@@ -109,6 +108,9 @@ class SoundManager:
             if SoundManager._initialized:
                 return
             try:
+                # Deferred: pydub is only needed for this one-off volume pass on the executor.
+                from pydub import AudioSegment
+
                 on_path = PathManager.get_resource_path(BEEP_ON_FILENAME)
                 off_path = PathManager.get_resource_path(BEEP_OFF_FILENAME)
 
@@ -116,26 +118,25 @@ class SoundManager:
                 out_on_path = os.path.join(temp_dir, "ozmoz_beep_on.wav")
                 out_off_path = os.path.join(temp_dir, "ozmoz_beep_off.wav")
 
-                SoundManager.beep_on_path = on_path
-                SoundManager.beep_off_path = off_path
-
                 if os.path.exists(on_path):
+                    SoundManager.beep_on_path = on_path
                     try:
                         audio_on = AudioSegment.from_wav(on_path) - 10.0
                         audio_on.export(out_on_path, format="wav")
                         if os.path.exists(out_on_path):
                             SoundManager.beep_on_path = out_on_path
                     except Exception as e:
-                        logger.error(f"Failed to lower volume for beep_on: {e}")
+                        logger.error("Failed to lower volume for beep_on: %s", e)
 
                 if os.path.exists(off_path):
+                    SoundManager.beep_off_path = off_path
                     try:
                         audio_off = AudioSegment.from_wav(off_path) - 10.0
                         audio_off.export(out_off_path, format="wav")
                         if os.path.exists(out_off_path):
                             SoundManager.beep_off_path = out_off_path
                     except Exception as e:
-                        logger.error(f"Failed to lower volume for beep_off: {e}")
+                        logger.error("Failed to lower volume for beep_off: %s", e)
 
                 SoundManager._initialized = True
             except Exception:
@@ -147,8 +148,9 @@ class SoundManager:
         if not SoundManager._initialized:
             self._initialize()
 
+        # _initialize only stores paths it has verified, so no stat per beep.
         sound_path = SoundManager.beep_on_path if sound_name == "beep_on" else SoundManager.beep_off_path
-        if not sound_path or not os.path.exists(sound_path):
+        if not sound_path:
             return
 
         try:
@@ -157,7 +159,32 @@ class SoundManager:
                 winsound.SND_FILENAME | winsound.SND_NODEFAULT | winsound.SND_ASYNC
             )
         except Exception:
-            logger.exception("Failed to play sound")
+            if os.path.exists(sound_path):
+                logger.exception("Failed to play sound")
+                return
+            # The quieter copy lives in the temp dir and can be cleaned up while the app runs.
+            logger.debug("Sound file %s is missing, falling back to the bundled beep", sound_path)
+            self._fall_back_to_bundled(sound_name, sound_path)
+
+    def _fall_back_to_bundled(self, sound_name: str, missing_path: str) -> None:
+        filename = BEEP_ON_FILENAME if sound_name == "beep_on" else BEEP_OFF_FILENAME
+        bundled_path = PathManager.get_resource_path(filename)
+        if bundled_path == missing_path or not os.path.exists(bundled_path):
+            bundled_path = None
+
+        if sound_name == "beep_on":
+            SoundManager.beep_on_path = bundled_path
+        else:
+            SoundManager.beep_off_path = bundled_path
+
+        if bundled_path:
+            try:
+                winsound.PlaySound(
+                    bundled_path,
+                    winsound.SND_FILENAME | winsound.SND_NODEFAULT | winsound.SND_ASYNC
+                )
+            except Exception:
+                logger.exception("Failed to play sound")
 
 
 class ClipboardManager:
@@ -14,6 +14,7 @@ class VocabularyManager:
         self.filepath = get_portable_data_dir() / "vocabulary.json"
         self.event_bus = event_bus
         self._words = []
+        self._prompt_text = None
         self._load()
 
     def _load(self) -> None:
@@ -38,6 +39,7 @@ class VocabularyManager:
         if not word or word in self._words:
             return False
         self._words.append(word)
+        self._prompt_text = None
         self._save()
         self._notify_change()
         return True
@@ -45,12 +47,19 @@ class VocabularyManager:
     def remove_word(self, index: int) -> None:
         if 0 <= index < len(self._words):
             del self._words[index]
+            self._prompt_text = None
             self._save()
             self._notify_change()
 
     def get_words(self) -> list:
         return list(self._words)
 
+    def get_prompt_text(self) -> str:
+        """Returns the words joined for the transcription prompt, rebuilt only after edits."""
+        if self._prompt_text is None:
+            self._prompt_text = ", ".join(self._words)
+        return self._prompt_text
+
     def _notify_change(self) -> None:
         if self.event_bus:
             self.event_bus.publish("vocabulary_updated", None)
\ No newline at end of file
@@ -5,11 +5,18 @@ from PySide6.QtGui import QGuiApplication, QDesktopServices
 from datetime import datetime, timedelta
 import logging
 
-from src.audio.local_audio import local_whisper
+from src.audio.local_audio import MODELS_CONFIG, local_whisper
+from src.core.config import GROQ_MODEL_MAPPING
 from src.core.system import global_executor
 
 logger = logging.getLogger(__name__)
 
+# Per-bar weights shaping the visualizer into a centered bell.
+BAR_BELL_CURVE = (0.50, 0.65, 0.80, 0.90, 1.0, 0.90, 0.80, 0.65, 0.50)
+
+MONTHS_EN = ("", "January", "February", "March", "April", "May", "June",
+             "July", "August", "September", "October", "November", "December")
+
 
 class UIBridge(QObject):
     activeChanged = Signal(bool)
@@ -61,10 +68,14 @@ class UIBridge(QObject):
         self._smooth = [0.0] * self.NUM_BARS
         self._run_max = 1.0
         self._startup_frames = 0
+        self._fft_layout = None
         self._stats = {"avgSpeed": "0 WPM", "wordsThisWeek": "0", "timeSaved": "0 minutes"}
         self._changelog = []
-        self._history_list = []
+        self._history_json = "[]"
 
+        if self.changelog_manager:
+            # Ships with the app; loaded once here instead of on every history change.
+            self._changelog = self.changelog_manager.get_changelog()
         if self.stats_manager and self.changelog_manager:
             self.refresh_home_data()
 
@@ -127,7 +138,7 @@ class UIBridge(QObject):
     @Property(str, notify=modeChanged)
     def installedLocalModelsJson(self):
         installed = []
-        for m in ["Local Whisper Base", "Local Whisper Small", "Local Whisper Turbo", "Local Distil-Whisper (EN)"]:
+        for m in MODELS_CONFIG:
             if local_whisper.is_installed(m):
                 installed.append(m)
         return json.dumps(installed)
@@ -169,9 +180,11 @@ class UIBridge(QObject):
     @Slot(str, str, str)
     def applyActiveModeSettings(self, preset, language, voice_model):
         if self.mode_manager:
-            self.mode_manager.update_mode("system", "active_preset", preset)
-            self.mode_manager.update_mode("system", "active_language", language)
-            self.mode_manager.update_mode("system", "active_model", voice_model)
+            self.mode_manager.update_mode_values("system", {
+                "active_preset": preset,
+                "active_language": language,
+                "active_model": voice_model
+            })
 
     @Slot()
     def setActiveDefaultMode(self):
@@ -218,13 +231,13 @@ class UIBridge(QObject):
     @Slot(str)
     def setActiveModeId(self, mode_id):
         if self.mode_manager:
-            self.mode_manager.update_mode("system", "current_active", mode_id)
             m = self.mode_manager.get_mode(mode_id)
-            self.applyActiveModeSettings(
-                m.get("preset", "Voice to text"),
-                m.get("language", "English"),
-                m.get("voice_model", "Whisper V3 Turbo")
-            )
+            self.mode_manager.update_mode_values("system", {
+                "current_active": mode_id,
+                "active_preset": m.get("preset", "Voice to text"),
+                "active_language": m.get("language", "English"),
+                "active_model": m.get("voice_model", "Whisper V3 Turbo")
+            })
 
     @Property(bool, notify=settingsChanged)
     def playSounds(self):
@@ -273,22 +286,21 @@ class UIBridge(QObject):
         self.vocabularyChanged.emit()
 
     def refresh_home_data(self):
+        # One snapshot of the history feeds both the stats and the history list.
+        history = self.hist_manager.get_all() if self.hist_manager else None
         if self.stats_manager and self.changelog_manager:
-            self._stats = self.stats_manager.get_home_stats()
-            self._changelog = self.changelog_manager.get_changelog()
+            self._stats = self.stats_manager.get_home_stats(history)
             self.statsChanged.emit()
-            self.changelogChanged.emit()
         if self.hist_manager:
-            self.refresh_history_data()
+            self.refresh_history_data(history)
 
-    def refresh_history_data(self):
-        raw_history = self.hist_manager.get_all()
+    def refresh_history_data(self, raw_history=None):
+        if raw_history is None:
+            raw_history = self.hist_manager.get_all()
         raw_history.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
 
         today = datetime.now().date()
         yesterday = today - timedelta(days=1)
-        months_en = ["", "January", "February", "March", "April", "May", "June",
-                     "July", "August", "September", "October", "November", "December"]
 
         formatted = []
         for item in raw_history:
@@ -296,13 +308,14 @@ class UIBridge(QObject):
             try:
                 dt_obj = datetime.fromisoformat(ts_str)
                 dt_date = dt_obj.date()
+                day_label = f"{dt_obj.day} {MONTHS_EN[dt_obj.month]} {dt_obj.year}"
                 if dt_date == today:
                     date_group = "Today"
                 elif dt_date == yesterday:
                     date_group = "Yesterday"
                 else:
-                    date_group = f"{dt_obj.day} {months_en[dt_obj.month]} {dt_obj.year}"
-                details_date = f"{dt_obj.day} {months_en[dt_obj.month]} {dt_obj.year} at {dt_obj.strftime('%H:%M')}"
+                    date_group = day_label
+                details_date = f"{day_label} at {dt_obj.hour:02d}:{dt_obj.minute:02d}"
             except Exception:
                 date_group = "Unknown Date"
                 details_date = ""
@@ -323,7 +336,8 @@ class UIBridge(QObject):
                 "transcriptionDuration": item.get("processing_time_sec", 0)
             })
 
-        self._history_list = formatted
+        # Serialized once here; QML reads the property several times per refresh.
+        self._history_json = json.dumps(formatted)
         self.historyChanged.emit()
 
     def on_history_updated(self, data):
@@ -331,7 +345,7 @@ class UIBridge(QObject):
 
     @Property(str, notify=historyChanged)
     def historyListJson(self):
-        return json.dumps(self._history_list)
+        return self._history_json
 
     @Slot(str)
     def deleteHistoryEntry(self, entry_id):
@@ -342,12 +356,10 @@ class UIBridge(QObject):
     def clearAllHistory(self):
         if self.hist_manager:
             try:
-                self.hist_manager.filepath.write_text("[]", encoding="utf-8")
-                if self.hist_manager.event_bus:
-                    self.hist_manager.event_bus.publish("history_updated", None)
+                self.hist_manager.clear()
                 self.refresh_home_data()
             except Exception as e:
-                logger.error(f"Error clearing history: {e}")
+                logger.error("Error clearing history: %s", e)
 
     @Slot(str)
     def copyToClipboard(self, text):
@@ -393,21 +405,26 @@ class UIBridge(QObject):
     def saveGroqKey(self, key):
         self.cred_manager.save_api_key("groq", key)
 
+        mode_updated = False
         if self.mode_manager:
             if key and key.strip():
                 current_model = self.mode_manager.get_mode("default").get("voice_model", "Select a model...")
                 if current_model == "Select a model...":
                     self.mode_manager.update_mode("default", "voice_model", "Whisper V3 Turbo")
+                    mode_updated = True
             else:
                 self.mode_manager.update_mode("default", "voice_model", "Select a model...")
+                mode_updated = True
 
                 sys_cfg = self.mode_manager.get_mode("system")
                 active_model = sys_cfg.get("active_model", "Select a model...")
-                if active_model in ["Whisper V3", "Whisper V3 Turbo"]:
+                if active_model in GROQ_MODEL_MAPPING:
                     self.mode_manager.update_mode("system", "active_model", "Select a model...")
 
         self.credentialsChanged.emit()
-        self.modeChanged.emit()
+        # A mode update already reaches QML through "mode_updated"; a second notify re-reads every binding.
+        if not mode_updated:
+            self.modeChanged.emit()
 
     def on_update_available(self, data):
         self.updateStatusChanged.emit("available", f"Version {data['version']} available!")
@@ -434,9 +451,8 @@ class UIBridge(QObject):
 
     def on_recording_stopped(self, data):
         self._active = False
-        self._levels = [2.0] * self.NUM_BARS
         self.activeChanged.emit(False)
-        self.levelsChanged.emit(self._levels)
+        self._set_levels([2.0] * self.NUM_BARS)
 
     def on_audio_frame(self, audio_data: bytes):
         try:
@@ -444,27 +460,17 @@ class UIBridge(QObject):
         except Exception:
             logger.exception("on_audio_frame failed unexpectedly")
 
-    def _process_audio_frame(self, audio_data: bytes):
-        if not self._active:
-            return
-        data = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
-        rms = float(np.sqrt(np.mean(data ** 2)))
-
-        if rms < 20.0:
-            self._smooth = [s * 0.55 for s in self._smooth]
-            self._levels = [max(2.0, float(s * 26)) for s in self._smooth]
-            self.levelsChanged.emit(self._levels)
-            return
+    def _get_fft_layout(self, N: int):
+        """Window and log-spaced band edges only depend on the frame size, so build them once."""
+        if self._fft_layout is not None and self._fft_layout[0] == N:
+            return self._fft_layout[1:]
 
-        N = len(data)
-        fft = np.abs(np.fft.rfft(data * np.hanning(N)))
-
-        bin_hz = (16000 / 2) / len(fft)
+        fft_len = N // 2 + 1
+        bin_hz = (16000 / 2) / fft_len
         lo = int(100 / bin_hz)
         hi = int(4000 / bin_hz)
-        speech = fft[lo:hi]
 
-        band_count = len(speech)
+        band_count = len(range(fft_len)[lo:hi])
         if band_count > 0:
             log_edges = np.round(np.logspace(0, np.log10(band_count), self.NUM_BARS + 1)).astype(int)
             log_edges[0] = 0
@@ -472,19 +478,35 @@ class UIBridge(QObject):
             for i in range(1, len(log_edges)):
                 if log_edges[i] <= log_edges[i - 1]:
                     log_edges[i] = log_edges[i - 1] + 1
+            log_edges = np.minimum(log_edges, band_count)
         else:
-            log_edges = np.linspace(0, 0, self.NUM_BARS + 1).astype(int)
+            log_edges = np.zeros(self.NUM_BARS + 1, dtype=int)
 
-        levels_freq = []
-        for i in range(self.NUM_BARS):
-            band = speech[log_edges[i]:log_edges[i + 1]]
-            raw_val = float(np.sum(band)) if len(band) else 0.0
-            compressed = raw_val ** 0.5
-            levels_freq.append(compressed)
+        # float32 window keeps the frame in single precision; float64 would double the bytes per FFT.
+        self._fft_layout = (N, np.hanning(N).astype(np.float32), lo, hi, log_edges)
+        return self._fft_layout[1:]
+
+    def _process_audio_frame(self, audio_data: bytes):
+        if not self._active:
+            return
+        data = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
+        rms = float(np.sqrt(np.mean(data ** 2)))
 
-        peak_freq = max(levels_freq) if max(levels_freq) > 0 else 1e-6
+        if rms < 20.0:
+            self._smooth = [s * 0.55 for s in self._smooth]
+            self._set_levels([max(2.0, float(s * 26)) for s in self._smooth])
+            return
+
+        window, lo, hi, log_edges = self._get_fft_layout(len(data))
+        speech = np.abs(np.fft.rfft(data * window))[lo:hi]
+
+        # Band sums as differences of one cumulative sum instead of a Python loop over slices.
+        cumulative = np.concatenate((np.zeros(1, dtype=np.float32), np.cumsum(speech)))
+        levels_freq = np.sqrt(cumulative[log_edges[1:]] - cumulative[log_edges[:-1]])
+
+        peak_freq = float(levels_freq.max()) if levels_freq.max() > 0 else 1e-6
         self._run_max = max(self._run_max * 0.995, peak_freq)
-        norm_freq = [l / self._run_max for l in levels_freq]
+        norm_freq = (levels_freq / self._run_max).tolist()
 
         norm_rms = min(1.0, (rms / 32768.0) * 15)
 
@@ -492,20 +514,23 @@ class UIBridge(QObject):
             self._startup_frames -= 1
             norm_rms = min(norm_rms, 0.15)
 
-        bell_curve = [0.50, 0.65, 0.80, 0.90, 1.0, 0.90, 0.80, 0.65, 0.50]
-
         final_levels = []
         for i in range(self.NUM_BARS):
             blended = (norm_freq[i] * 0.6) + (norm_rms * 0.4)
-            final_levels.append(blended * bell_curve[i])
+            final_levels.append(blended * BAR_BELL_CURVE[i])
 
         self._smooth = [
             0.75 * n + 0.25 * s if n > s else 0.20 * n + 0.80 * s
             for n, s in zip(final_levels, self._smooth)
         ]
 
-        self._levels = [min(26.0, max(2.0, float(s * 26))) for s in self._smooth]
-        self.levelsChanged.emit(self._levels)
+        self._set_levels([min(26.0, max(2.0, float(s * 26))) for s in self._smooth])
+
+    def _set_levels(self, levels: list) -> None:
+        # Silence decays to a constant floor; skip re-sending identical bars to QML every frame.
+        if levels != self._levels:
+            self._levels = levels
+            self.levelsChanged.emit(levels)
 
     @Property(bool, notify=activeChanged)
     def active(self):